@@ -0,0 +1,20 @@
+"""
+PDF and DOCX text extraction for main.py's document process pool. It lives
+outside main.py so pool workers only import this module and the parsers,
+never the models, the database engine or the app's background threads.
+"""
+from typing import List
+
+from docx import Document
+from PyPDF2 import PdfReader
+
+def count_pdf_pages(path: str) -> int:
+    return len(PdfReader(path).pages)
+
+def extract_pdf_pages(path: str, start: int, end: int) -> List[str]:
+    """Text of PDF pages start..end-1"""
+    reader = PdfReader(path)
+    return [reader.pages[i].extract_text() or "" for i in range(start, end)]
+
+def extract_docx_paragraphs(path: str) -> List[str]:
+    return [para.text for para in Document(path).paragraphs]
@@ -0,0 +1,375 @@
+"""
+In-process benchmark suite for the API.
+
+Runs every case through FastAPI's TestClient against a throwaway SQLite
+database, with the stand-in models from stand_ins.py (or the real models
+where they are cached locally), and writes the timings as JSON so runs can
+be compared across commits:
+
+    python tests/benchmark.py --output before.json
+    python tests/benchmark.py --output after.json --compare before.json --threshold 0.2
+
+--compare exits with status 1 when any case's median got slower than the
+baseline by more than the threshold. Only compare runs made with the same
+models on the same machine.
+
+--profiles also prints a latency/quality table for the translation
+generation profiles, scored with chrF against a small reference set.
+Quality numbers only mean something with the real translation model.
+"""
+import argparse
+import json
+import math
+import os
+import platform
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+from datetime import datetime
+from time import perf_counter
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+BACKEND_DIR = os.path.dirname(TESTS_DIR)
+
+# Run against a throwaway SQLite database and upload directory, with no
+# background threads competing for the CPU
+START_DIR = os.getcwd()
+WORK_DIR = tempfile.mkdtemp(prefix="benchmark-")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{WORK_DIR}/benchmark.db")
+os.environ.setdefault("JOB_WORKERS", "0")
+os.environ.setdefault("GC_INTERVAL", "0")
+os.environ.setdefault("PREWARM", "0")
+# Repeated texts would be answered from the translation memory and TTS
+# cache instead of the models; translation_memory_benchmark.py measures
+# the memory itself
+os.environ.setdefault("TRANSLATION_MEMORY", "0")
+os.environ.setdefault("TTS_CACHE_MAX_ENTRIES", "0")
+os.environ.setdefault("LEXICON_PATH", os.path.join(BACKEND_DIR, "lexicon.tsv"))
+os.chdir(WORK_DIR)
+sys.path.insert(0, BACKEND_DIR)
+sys.path.insert(0, TESTS_DIR)
+
+from fastapi.testclient import TestClient
+
+import main
+from fixtures import build_docx, build_pdf, build_wav
+from stand_ins import install_models
+
+SEED_USERS = 50
+SEED_POSTS = 500
+SEED_COMMENTS_PER_POST = 4
+SEED_CHAT_MESSAGES = 2000
+
+TRANSLATE_SHORT = "Hello, how are you?"
+TRANSLATE_LONG = (
+    "The process of language acquisition involves both conscious and unconscious elements. "
+    "When learning a new language, we must pay attention to vocabulary, grammar, "
+    "pronunciation, and cultural context. This multi-faceted approach helps develop fluency over time."
+)
+TRANSLATE_WORD = "Beautiful"  # Answered by the lexicon
+TRANSLATE_VIETNAMESE = "Việt Nam có nhiều món ăn ngon và cảnh đẹp. Tôi rất thích văn hóa Việt Nam."
+TTS_SHORT = "This is a short sentence for testing."
+TTS_LONG = "This is a very long text. " * 12
+GRAMMAR_TEXT = "i has a apple and and she go to school yesterday."
+# What one lesson screen asks for: the same items sent as separate /chat calls or one /chat/batch
+LESSON_ITEMS = (
+    [{"text": f"Lesson sentence number {n}: where is the station?", "action": "translate"} for n in range(6)]
+    + [{"text": f"Lesson word {n}", "action": "tts"} for n in range(4)]
+    + [{"text": GRAMMAR_TEXT, "action": "grammar"}, {"text": TRANSLATE_VIETNAMESE, "action": "translate"}]
+)
+# (source, source language, target language, reference translation)
+REFERENCE_TRANSLATIONS = [
+    ("Hello, how are you?", "eng", "vie", "Xin chào, bạn có khỏe không?"),
+    ("I am learning Vietnamese.", "eng", "vie", "Tôi đang học tiếng Việt."),
+    ("The weather is nice today.", "eng", "vie", "Hôm nay thời tiết đẹp."),
+    ("Where is the train station?", "eng", "vie", "Nhà ga xe lửa ở đâu?"),
+    ("My family lives in Hanoi.", "eng", "vie", "Gia đình tôi sống ở Hà Nội."),
+    ("Thank you very much for your help.", "eng", "vie", "Cảm ơn bạn rất nhiều vì đã giúp đỡ."),
+    ("Learning a new language takes time and patience.", "eng", "vie", "Học một ngôn ngữ mới cần thời gian và sự kiên nhẫn."),
+    (
+        "Vietnam is a beautiful country with a rich culture and history, and I hope to visit it someday with my friends.",
+        "eng", "vie",
+        "Việt Nam là một đất nước xinh đẹp với nền văn hóa và lịch sử phong phú, và tôi hy vọng một ngày nào đó sẽ đến thăm cùng bạn bè.",
+    ),
+    ("Bạn tên là gì?", "vie", "eng", "What is your name?"),
+    ("Tôi rất thích văn hóa Việt Nam.", "vie", "eng", "I really like Vietnamese culture."),
+    ("Việt Nam có nhiều món ăn ngon.", "vie", "eng", "Vietnam has many delicious dishes."),
+    ("Hôm qua tôi đi chợ với mẹ tôi.", "vie", "eng", "Yesterday I went to the market with my mother."),
+]
+DOCUMENT_PARAGRAPH = (
+    "Margaret Preston was born in Port Adelaide in 1875. She studied art in Melbourne and Europe "
+    "and became one of the most important Australian modernist painters."
+)
+
+def git_commit():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=BACKEND_DIR, text=True).strip()
+    except Exception:
+        return None
+
+def seed_database():
+    """Users, posts, comments and chat history for the list endpoints; returns a user id"""
+    db = main.SessionLocal()
+    try:
+        now = datetime.utcnow()
+        db.bulk_insert_mappings(main.User, [
+            {"username": f"user{i}", "email": f"user{i}@example.com", "password_hash": "x", "bio": f"Learner {i}", "created_at": now}
+            for i in range(1, SEED_USERS + 1)
+        ])
+        db.bulk_insert_mappings(main.Post, [
+            {"user_id": i % SEED_USERS + 1, "title": f"Post {i}", "description": DOCUMENT_PARAGRAPH, "created_at": now}
+            for i in range(SEED_POSTS)
+        ])
+        db.bulk_insert_mappings(main.Comment, [
+            {"post_id": i // SEED_COMMENTS_PER_POST + 1, "user_id": i % SEED_USERS + 1, "comment_text": f"Comment {i}", "created_at": now}
+            for i in range(SEED_POSTS * SEED_COMMENTS_PER_POST)
+        ])
+        db.bulk_insert_mappings(main.ChatMessage, [
+            {"user_id": 1, "user_input": TRANSLATE_SHORT, "action": "translate", "response": f"Xin chào ({i})", "created_at": now}
+            for i in range(SEED_CHAT_MESSAGES)
+        ])
+        db.commit()
+        return 1
+    finally:
+        db.close()
+
+class Case:
+    def __init__(self, name, group, request, setup=None):
+        self.name = name
+        self.group = group
+        self.request = request  # (client, iteration) -> response
+        self.setup = setup  # Runs untimed before every iteration
+
+def build_cases(user_id):
+    pdf_pages = [[f"Page {page + 1}."] + [DOCUMENT_PARAGRAPH[i:i + 90] for i in range(0, len(DOCUMENT_PARAGRAPH), 90)] * 4 for page in range(20)]
+    pdf = build_pdf(pdf_pages)
+    docx_paragraphs = [DOCUMENT_PARAGRAPH] * 100
+    wav = build_wav()
+
+    def chat(text, action):
+        return lambda client, i: client.post("/chat", json={"user_id": user_id, "text": text, "action": action})
+
+    def chat_sequential(items):
+        def request(client, i):
+            for item in items:
+                response = client.post("/chat", json={"user_id": user_id, **item})
+                if response.status_code != 200:
+                    break
+            return response
+        return request
+
+    def upload_document(content, content_type, name):
+        return lambda client, i: client.post("/document/extract", files={"file": (name, content(i), content_type)})
+
+    def invalidate(*namespaces):
+        return lambda: main.response_cache.invalidate(*namespaces)
+
+    cases = [
+        Case("translate_short", "translate", chat(TRANSLATE_SHORT, "translate")),
+        Case("translate_long", "translate", chat(TRANSLATE_LONG, "translate")),
+        Case("translate_vietnamese", "translate", chat(TRANSLATE_VIETNAMESE, "translate")),
+        Case("translate_word", "translate", chat(TRANSLATE_WORD, "translate")),
+        Case("tts_short", "tts", chat(TTS_SHORT, "tts")),
+        Case("tts_long", "tts", chat(TTS_LONG, "tts")),
+        Case("grammar", "grammar", chat(GRAMMAR_TEXT, "grammar")),
+        Case("lesson_sequential", "batch", chat_sequential(LESSON_ITEMS)),
+        Case("lesson_batch", "batch", lambda client, i: client.post("/chat/batch", json={"user_id": user_id, "items": LESSON_ITEMS})),
+        # Every iteration gets different bytes so the extracted text cache never hits
+        Case("extract_pdf_20_pages", "extraction", upload_document(
+            lambda i: build_pdf(pdf_pages + [[f"Iteration {i}"]]), main.PDF_CONTENT_TYPE, "bench.pdf")),
+        Case("extract_docx_100_paragraphs", "extraction", upload_document(
+            lambda i: build_docx(docx_paragraphs + [f"Iteration {i}"]), main.DOCX_CONTENT_TYPE, "bench.docx")),
+        Case("extract_pdf_cached", "extraction", upload_document(lambda i: pdf, main.PDF_CONTENT_TYPE, "bench.pdf")),
+        Case("list_users", "lists", lambda client, i: client.get("/users"), invalidate("users")),
+        Case("list_posts", "lists", lambda client, i: client.get("/posts"), invalidate("posts")),
+        Case("list_posts_cached", "lists", lambda client, i: client.get("/posts")),
+        Case("feed", "lists", lambda client, i: client.get("/feed?limit=20&comments=3"), invalidate("feed")),
+        Case("chat_history", "lists", lambda client, i: client.get(f"/chat/history/{user_id}")),
+    ]
+    # whisper.load_audio decodes with the ffmpeg binary
+    if shutil.which("ffmpeg"):
+        cases.insert(9, Case("stt", "stt", lambda client, i: client.post(
+            "/speech-to-text",
+            data={"user_id": str(user_id)},
+            files={"audio_file": ("bench.wav", wav, "audio/wav")},
+        )))
+    return cases
+
+def chrf(hypotheses, references, max_order=6, beta=2.0):
+    """Corpus chrF (character n-gram F-score, 0-100), as in sacreBLEU's defaults"""
+    def ngrams(text, n):
+        text = text.replace(" ", "")
+        counts = {}
+        for i in range(len(text) - n + 1):
+            gram = text[i:i + n]
+            counts[gram] = counts.get(gram, 0) + 1
+        return counts
+
+    precisions, recalls = [], []
+    for n in range(1, max_order + 1):
+        matched = hypothesis_total = reference_total = 0
+        for hypothesis, reference in zip(hypotheses, references):
+            hypothesis_grams, reference_grams = ngrams(hypothesis, n), ngrams(reference, n)
+            matched += sum(min(count, reference_grams.get(gram, 0)) for gram, count in hypothesis_grams.items())
+            hypothesis_total += sum(hypothesis_grams.values())
+            reference_total += sum(reference_grams.values())
+        if hypothesis_total and reference_total:
+            precisions.append(matched / hypothesis_total)
+            recalls.append(matched / reference_total)
+    if not precisions:
+        return 0.0
+    precision = sum(precisions) / len(precisions)
+    recall = sum(recalls) / len(recalls)
+    if precision + recall == 0:
+        return 0.0
+    return 100 * (1 + beta ** 2) * precision * recall / (beta ** 2 * precision + recall)
+
+def run_profile_table(repeat):
+    """Latency and chrF of every generation profile over REFERENCE_TRANSLATIONS"""
+    table = {}
+    for profile in main.GENERATION_PROFILES:
+        latencies, hypotheses = [], []
+        for source, source_lang, target_lang, _ in REFERENCE_TRANSLATIONS:
+            main.translate_text(source, source_lang, target_lang, profile)  # warm up
+            timings = []
+            for _ in range(repeat):
+                start = perf_counter()
+                output = main.translate_text(source, source_lang, target_lang, profile)
+                timings.append(perf_counter() - start)
+            latencies.append(sorted(timings)[len(timings) // 2])
+            # The model prefixes its output with the target language ("vi: ...")
+            hypotheses.append(re.sub(r"^\w{2,3}:\s*", "", output))
+        latencies.sort()
+        table[profile] = {
+            "settings": main.GENERATION_PROFILES[profile],
+            "p50_ms": percentile(latencies, 0.50) * 1000,
+            "max_ms": latencies[-1] * 1000,
+            "chrf": chrf(hypotheses, [reference for *_, reference in REFERENCE_TRANSLATIONS]),
+        }
+    return table
+
+def print_profile_table(table, model):
+    print(f"\nTranslation profiles ({model} model; per-sentence median over {len(REFERENCE_TRANSLATIONS)} references)")
+    print("| Profile | Beams | Length budget | p50 ms | max ms | chrF |")
+    print("|---|---|---|---|---|---|")
+    for profile, row in table.items():
+        settings = row["settings"]
+        budget = f"{settings['length_ratio']:g} x input + {settings['length_margin']}"
+        print(f"| {profile} | {settings['num_beams']} | {budget} | {row['p50_ms']:.1f} | {row['max_ms']:.1f} | {row['chrf']:.1f} |")
+
+def percentile(sorted_values, fraction):
+    index = min(len(sorted_values) - 1, max(0, math.ceil(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+def run_case(client, case, repeat, warmup):
+    timings = []
+    errors = 0
+    for i in range(warmup + repeat):
+        if case.setup is not None:
+            case.setup()
+        start = perf_counter()
+        response = case.request(client, i)
+        elapsed = perf_counter() - start
+        if response.status_code != 200:
+            errors += 1
+            if errors == 1:
+                print(f"  {case.name}: HTTP {response.status_code} {response.text[:200]}")
+            continue
+        if i >= warmup:
+            timings.append(elapsed)
+    timings.sort()
+    result = {"group": case.group, "iterations": len(timings), "errors": errors}
+    if timings:
+        result.update({
+            "mean_ms": sum(timings) / len(timings) * 1000,
+            "p50_ms": percentile(timings, 0.50) * 1000,
+            "p95_ms": percentile(timings, 0.95) * 1000,
+            "min_ms": timings[0] * 1000,
+            "max_ms": timings[-1] * 1000,
+        })
+    return result
+
+def compare(results, baseline, threshold):
+    """Print a comparison against a baseline run; returns the regressed case names"""
+    if baseline["meta"].get("models") != results["meta"].get("models"):
+        print("Warning: the baseline was run with different models, timings are not comparable")
+    regressions = []
+    print(f"\n{'Case':<30} {'Baseline p50':>13} {'Current p50':>12} {'Change':>8}")
+    for name, current in results["cases"].items():
+        previous = baseline["cases"].get(name)
+        if not previous or "p50_ms" not in previous or "p50_ms" not in current:
+            print(f"{name:<30} {'-':>13} {current.get('p50_ms', float('nan')):>12.2f} {'new':>8}")
+            continue
+        change = current["p50_ms"] / previous["p50_ms"] - 1
+        flag = ""
+        if change > threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(f"{name:<30} {previous['p50_ms']:>13.2f} {current['p50_ms']:>12.2f} {change:>+7.0%}{flag}")
+    return regressions
+
+def main_cli():
+    parser = argparse.ArgumentParser(description="Offline API benchmark")
+    parser.add_argument("--repeat", type=int, default=20, help="Timed iterations per case")
+    parser.add_argument("--warmup", type=int, default=3, help="Untimed iterations per case")
+    parser.add_argument("--models", choices=["auto", "stand-in"], default="auto",
+                        help="auto uses real models that are already cached locally")
+    parser.add_argument("--only", help="Comma separated groups or case names to run")
+    parser.add_argument("--profiles", action="store_true", help="Also build the translation profile latency/quality table")
+    parser.add_argument("--output", default=os.path.join(BACKEND_DIR, "benchmark_results.json"))
+    parser.add_argument("--compare", help="Baseline results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed p50 slowdown before failing, e.g. 0.2 = 20%%")
+    args = parser.parse_args()
+    output_path = os.path.join(START_DIR, args.output)
+
+    models = install_models(main, args.models)
+    user_id = seed_database()
+    cases = build_cases(user_id)
+    if args.only:
+        selected = set(args.only.split(","))
+        cases = [case for case in cases if case.name in selected or case.group in selected]
+
+    print("===== API Benchmark =====")
+    print(f"Models: {', '.join(f'{task}={kind}' for task, kind in models.items())}")
+    results = {
+        "meta": {
+            "commit": git_commit(),
+            "created_at": datetime.utcnow().isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "models": models,
+            "repeat": args.repeat,
+            "warmup": args.warmup,
+        },
+        "cases": {},
+    }
+    with TestClient(main.app) as client:
+        for case in cases:
+            result = run_case(client, case, args.repeat, args.warmup)
+            results["cases"][case.name] = result
+            if "p50_ms" in result:
+                print(f"{case.name:<30} p50 {result['p50_ms']:>9.2f} ms  p95 {result['p95_ms']:>9.2f} ms  errors {result['errors']}")
+            else:
+                print(f"{case.name:<30} failed ({result['errors']} errors)")
+    if args.profiles:
+        results["profiles"] = run_profile_table(max(1, args.repeat // 4))
+        print_profile_table(results["profiles"], models["translation"])
+
+    with open(output_path, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"\nResults written to {output_path}")
+
+    failed = [name for name, result in results["cases"].items() if result["errors"]]
+    regressions = []
+    if args.compare:
+        with open(os.path.join(START_DIR, args.compare)) as f:
+            regressions = compare(results, json.load(f), args.threshold)
+    shutil.rmtree(WORK_DIR, ignore_errors=True)
+    if failed or regressions:
+        print(f"\nFailed: {failed or 'none'}; regressions over {args.threshold:.0%}: {regressions or 'none'}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main_cli()
@@ -0,0 +1,75 @@
+"""
+Cache prewarm regression test. Audio the prewarm synthesizes is only held
+by the TTS cache, not by any chat_messages row, and must survive a storage
+GC pass so the next request for the text is still a cache hit.
+
+Runs in process against a throwaway SQLite database and upload directory,
+with the stand-in models from stand_ins.py:
+
+    python tests/cache_prewarm_test.py
+"""
+import os
+import sys
+import tempfile
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+BACKEND_DIR = os.path.dirname(TESTS_DIR)
+
+WORK_DIR = tempfile.mkdtemp(prefix="cache-prewarm-test-")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{WORK_DIR}/cache_prewarm_test.db")
+os.environ.setdefault("JOB_WORKERS", "0")
+os.environ.setdefault("GC_INTERVAL", "0")
+# The test runs the prewarm itself, and GC must not spare files for being new
+os.environ.setdefault("PREWARM", "0")
+os.environ.setdefault("GC_GRACE_SECONDS", "0")
+os.environ.setdefault("LEXICON_PATH", os.path.join(BACKEND_DIR, "lexicon.tsv"))
+os.chdir(WORK_DIR)
+sys.path.insert(0, BACKEND_DIR)
+sys.path.insert(0, TESTS_DIR)
+
+from fastapi.testclient import TestClient
+
+import main
+from stand_ins import install_models
+
+TTS_TEXT = "Good morning everyone, please open your books to the first lesson."
+
+def test_prewarmed_audio_survives_gc():
+    """Prewarm synthesizes a frequent TTS input, GC runs, /chat still hits the cache"""
+    print("\n===== Cache Prewarm Test =====")
+    install_models(main, "stand-in")
+    db = main.SessionLocal()
+    try:
+        user = main.User(username="prewarm", email="prewarm@example.com", password_hash="x")
+        db.add(user)
+        db.commit()
+        user_id = user.id
+        # Frequent input whose stored audio has expired, so the prewarm must synthesize it
+        for _ in range(3):
+            db.add(main.ChatMessage(
+                user_id=user_id,
+                user_input=TTS_TEXT,
+                action="tts",
+                response="Audio generated successfully",
+                detected_language=main.detect_language(TTS_TEXT),
+            ))
+        db.commit()
+    finally:
+        db.close()
+
+    main.CachePrewarmThread(delay=0, budget_seconds=60, top_n=10, lookback_days=1).prewarm()
+    assert main.PREWARM_ITEMS.values.get(("tts", "model")) == 1, main.PREWARM_ITEMS.values
+    print("Prewarm synthesized the TTS input")
+
+    report = main.run_storage_gc()
+    assert report["counts"].get("orphaned_audio", 0) == 0, report
+    print("Storage GC kept the prewarmed audio")
+
+    with TestClient(main.app) as client:
+        response = client.post("/chat", json={"user_id": user_id, "text": TTS_TEXT, "action": "tts"})
+    assert response.status_code == 200, response.text
+    assert response.json()["served_by"] == "tts_cache", response.json()
+    print("The next request was answered from the TTS cache")
+
+if __name__ == "__main__":
+    test_prewarmed_audio_survives_gc()
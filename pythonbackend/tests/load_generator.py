@@ -0,0 +1,229 @@
+"""
+Open-loop load generator for a running server.
+
+Requests arrive as a Poisson process at --rate per second for --duration
+seconds, whatever the server's response times, and each one is drawn from a
+weighted mix of real API calls. Latency is measured from when a request was
+scheduled, so time spent queued behind a slow server counts against it.
+
+    python main.py &
+    python tests/load_generator.py --rate 20 --duration 60
+    python tests/load_generator.py --mix chat_translate=5,feed=3,posts=2 --json load.json
+
+A test user is registered (or logged into) first. Results are reported per
+endpoint: throughput, p50/p95/p99 latency and error rate.
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import sys
+from time import perf_counter
+
+import httpx
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from fixtures import build_wav
+
+DEFAULT_MIX = {
+    "login": 2,
+    "chat_translate": 20,
+    "chat_tts": 8,
+    "chat_grammar": 8,
+    "stt": 4,
+    "posts": 20,
+    "feed": 25,
+    "chat_history": 13,
+}
+
+TEXTS = [
+    "Hello, how are you?",
+    "I am learning Vietnamese.",
+    "Vietnam is a beautiful country with a rich culture and history. I hope to visit someday.",
+    "Xin chào, bạn khỏe không?",
+    "Tôi đang học tiếng Anh.",
+]
+GRAMMAR_TEXTS = [
+    "i has a apple.",
+    "She go to school yesterday.",
+    "This sentence is fine.",
+]
+
+class LoadSession:
+    def __init__(self, client, email, password, user_id, rng):
+        self.client = client
+        self.email = email
+        self.password = password
+        self.user_id = user_id
+        self.rng = rng
+        self.wav = build_wav(seconds=3.0)
+
+    def chat(self, action, texts):
+        return self.client.post("/chat", json={"user_id": self.user_id, "text": self.rng.choice(texts), "action": action})
+
+    def request(self, name):
+        if name == "login":
+            return self.client.post("/auth/login", json={"email": self.email, "password": self.password})
+        if name == "chat_translate":
+            return self.chat("translate", TEXTS)
+        if name == "chat_tts":
+            return self.chat("tts", TEXTS)
+        if name == "chat_grammar":
+            return self.chat("grammar", GRAMMAR_TEXTS)
+        if name == "stt":
+            return self.client.post(
+                "/speech-to-text",
+                data={"user_id": str(self.user_id)},
+                files={"audio_file": ("load.wav", self.wav, "audio/wav")},
+            )
+        if name == "posts":
+            return self.client.get("/posts")
+        if name == "feed":
+            return self.client.get("/feed", params={"limit": 20, "offset": self.rng.choice([0, 0, 0, 20, 40])})
+        if name == "chat_history":
+            return self.client.get(f"/chat/history/{self.user_id}")
+        raise ValueError(f"Unknown endpoint '{name}' in the request mix")
+
+async def ensure_user(client, email, password):
+    """Register the load test user if needed and log in; returns its id"""
+    username = email.split("@")[0]
+    response = await client.post("/auth/register", json={"username": username, "email": email, "password": password})
+    if response.status_code not in (200, 400):
+        response.raise_for_status()
+    response = await client.post("/auth/login", json={"email": email, "password": password})
+    response.raise_for_status()
+    return response.json()["user_id"]
+
+def parse_mix(value):
+    mix = {}
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        mix[name.strip()] = float(weight or 1)
+    unknown = set(mix) - set(DEFAULT_MIX)
+    if unknown:
+        raise argparse.ArgumentTypeError(f"Unknown endpoints in mix: {', '.join(sorted(unknown))}")
+    return mix
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return float("nan")
+    index = min(len(sorted_values) - 1, max(0, math.ceil(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+async def run_load(args):
+    rng = random.Random(args.seed)
+    names = list(args.mix)
+    weights = [args.mix[name] for name in names]
+    limits = httpx.Limits(max_connections=args.max_in_flight, max_keepalive_connections=args.max_in_flight)
+    results = {name: {"latencies": [], "errors": {}} for name in names}
+
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout, limits=limits) as client:
+        user_id = await ensure_user(client, args.email, args.password)
+        session = LoadSession(client, args.email, args.password, user_id, rng)
+        in_flight = set()
+
+        async def fire(name, scheduled):
+            try:
+                response = await session.request(name)
+                outcome = None if response.status_code < 400 else f"HTTP {response.status_code}"
+            except httpx.TimeoutException:
+                outcome = "timeout"
+            except httpx.HTTPError as e:
+                outcome = type(e).__name__
+            latency = perf_counter() - scheduled
+            if outcome is None:
+                results[name]["latencies"].append(latency)
+            else:
+                errors = results[name]["errors"]
+                errors[outcome] = errors.get(outcome, 0) + 1
+
+        print(f"Sending ~{args.rate:g} req/s for {args.duration:g}s to {args.base_url} as user {user_id}...")
+        start = perf_counter()
+        scheduled = start
+        while True:
+            # Exponential gaps between arrivals make a Poisson process
+            scheduled += rng.expovariate(args.rate)
+            if scheduled - start > args.duration:
+                break
+            delay = scheduled - perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            name = rng.choices(names, weights)[0]
+            if len(in_flight) >= args.max_in_flight:
+                # Open loop: never wait for the server, count the arrival as shed instead
+                errors = results[name]["errors"]
+                errors["client overloaded"] = errors.get("client overloaded", 0) + 1
+                continue
+            task = asyncio.create_task(fire(name, scheduled))
+            in_flight.add(task)
+            task.add_done_callback(in_flight.discard)
+        if in_flight:
+            await asyncio.wait(in_flight)
+        elapsed = perf_counter() - start
+    return results, elapsed
+
+def summarize(results, elapsed):
+    summary = {}
+    all_latencies = []
+    total_errors = 0
+    for name, result in results.items():
+        latencies = sorted(result["latencies"])
+        errors = sum(result["errors"].values())
+        all_latencies.extend(latencies)
+        total_errors += errors
+        summary[name] = describe(latencies, errors, elapsed)
+        summary[name]["error_kinds"] = result["errors"]
+    summary["all"] = describe(sorted(all_latencies), total_errors, elapsed)
+    return summary
+
+def describe(latencies, errors, elapsed):
+    total = len(latencies) + errors
+    return {
+        "requests": total,
+        "ok": len(latencies),
+        "errors": errors,
+        "error_rate": errors / total if total else 0.0,
+        "throughput_rps": len(latencies) / elapsed if elapsed else 0.0,
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p95_ms": percentile(latencies, 0.95) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+        "max_ms": (latencies[-1] if latencies else float("nan")) * 1000,
+    }
+
+def print_summary(summary, elapsed):
+    print(f"\nCompleted in {elapsed:.1f}s")
+    print(f"{'Endpoint':<16} {'Requests':>8} {'OK/s':>7} {'Errors':>7} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9}")
+    for name, row in summary.items():
+        print(
+            f"{name:<16} {row['requests']:>8} {row['throughput_rps']:>7.2f} {row['error_rate']:>7.1%} "
+            f"{row['p50_ms']:>9.1f} {row['p95_ms']:>9.1f} {row['p99_ms']:>9.1f} {row['max_ms']:>9.1f}"
+        )
+        for kind, count in row.get("error_kinds", {}).items():
+            print(f"{'':<16}   {count} x {kind}")
+
+def main_cli():
+    parser = argparse.ArgumentParser(description="Open-loop load generator")
+    parser.add_argument("--base-url", default=os.getenv("BASE_URL", "http://localhost:8000"))
+    parser.add_argument("--rate", type=float, default=10.0, help="Mean arrivals per second")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds to generate arrivals for")
+    parser.add_argument("--mix", type=parse_mix, default=DEFAULT_MIX,
+                        help=f"Weighted endpoints, e.g. chat_translate=5,feed=3 (from: {', '.join(DEFAULT_MIX)})")
+    parser.add_argument("--max-in-flight", type=int, default=200, help="Arrivals beyond this many open requests are shed")
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--email", default="loadtest@example.com")
+    parser.add_argument("--password", default="loadtest-password")
+    parser.add_argument("--json", help="Also write the summary to this file")
+    args = parser.parse_args()
+
+    results, elapsed = asyncio.run(run_load(args))
+    summary = summarize(results, elapsed)
+    print_summary(summary, elapsed)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"args": {k: v for k, v in vars(args).items() if k != "password"}, "elapsed": elapsed, "endpoints": summary}, f, indent=2)
+
+if __name__ == "__main__":
+    main_cli()
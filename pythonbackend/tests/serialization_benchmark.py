@@ -0,0 +1,92 @@
+import json
+import os
+import sys
+import tempfile
+from datetime import datetime
+from time import perf_counter
+
+# Run against a throwaway SQLite database instead of the real one
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{tempfile.mkdtemp()}/serialization_benchmark.db")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.encoders import jsonable_encoder
+from main import (
+    SessionLocal, User, ChatMessage, ChatResponse, CHAT_RESPONSE_FIELDS,
+    encode_json, select_fields, orjson
+)
+
+ROW_COUNTS = [100, 1000, 10000]
+REPEATS = 5
+
+def seed_messages(count):
+    """Fill chat_messages with count rows for a single user"""
+    db = SessionLocal()
+    try:
+        user = db.query(User).filter(User.username == "bench").first()
+        if user is None:
+            user = User(username="bench", email="bench@example.com", password_hash="x")
+            db.add(user)
+            db.commit()
+        db.query(ChatMessage).delete()
+        db.bulk_insert_mappings(ChatMessage, [
+            {
+                "user_id": user.id,
+                "user_input": f"Hello, how are you today? ({i})",
+                "action": "translate",
+                "response": f"Xin chào, hôm nay bạn thế nào? ({i})",
+                "created_at": datetime.utcnow(),
+            }
+            for i in range(count)
+        ])
+        db.commit()
+    finally:
+        db.close()
+
+def orm_pydantic_path():
+    """The previous path: ORM objects, Pydantic orm_mode validation, stdlib json"""
+    db = SessionLocal()
+    try:
+        messages = db.query(ChatMessage).order_by(ChatMessage.created_at.desc()).all()
+        if hasattr(ChatResponse, "model_validate"):
+            models = [ChatResponse.model_validate(m, from_attributes=True) for m in messages]
+        else:
+            models = [ChatResponse.from_orm(m) for m in messages]
+        return json.dumps(jsonable_encoder(models)).encode("utf-8")
+    finally:
+        db.close()
+
+def fast_path():
+    """Column select, plain dicts and encode_json, as used by /chat/history"""
+    db = SessionLocal()
+    try:
+        rows = (
+            db.query(*select_fields(ChatMessage, CHAT_RESPONSE_FIELDS))
+            .order_by(ChatMessage.created_at.desc())
+            .all()
+        )
+        return encode_json([dict(zip(CHAT_RESPONSE_FIELDS, row)) for row in rows])
+    finally:
+        db.close()
+
+def best_of(func):
+    timings = []
+    for _ in range(REPEATS):
+        start = perf_counter()
+        func()
+        timings.append(perf_counter() - start)
+    return min(timings)
+
+def test_serialization_benchmark():
+    """Compare the ORM/Pydantic path with the fast path for /chat/history"""
+    print("===== Serialization Benchmark =====")
+    print(f"JSON encoder: {'orjson' if orjson is not None else 'stdlib json'}")
+    print(f"{'Rows':>8} {'ORM+Pydantic (ms)':>18} {'Fast path (ms)':>15} {'Speedup':>8}")
+    for count in ROW_COUNTS:
+        seed_messages(count)
+        assert json.loads(orm_pydantic_path()) == json.loads(fast_path())
+        slow = best_of(orm_pydantic_path)
+        fast = best_of(fast_path)
+        print(f"{count:>8} {slow * 1000:>18.1f} {fast * 1000:>15.1f} {slow / fast:>7.1f}x")
+
+if __name__ == "__main__":
+    test_serialization_benchmark()
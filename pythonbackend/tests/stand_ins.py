@@ -0,0 +1,158 @@
+"""
+Tiny deterministic stand-ins for the models main.py loads, so benchmarks can
+run offline on any machine. They keep the interfaces main.py calls (the
+tokenizers are real byte-level ones and the translation and Whisper models
+are the real architectures with small random weights), but their output is
+meaningless: use them to measure the request pipeline, not the models.
+
+install_models() uses the real models instead wherever they are already in
+the local cache, and never downloads anything.
+"""
+import os
+import shutil
+from pathlib import Path
+from types import SimpleNamespace
+
+import torch
+
+SEED = 0
+
+TRANSLATION_MODEL_NAME = "VietAI/envit5-translation"
+TTS_MODEL_NAMES = {"eng": "facebook/mms-tts-eng", "vie": "facebook/mms-tts-vie"}
+
+def hf_model_cached(model_name):
+    """Whether a Hugging Face model is in the local cache"""
+    try:
+        from huggingface_hub import try_to_load_from_cache
+    except ImportError:
+        return False
+    return isinstance(try_to_load_from_cache(model_name, "config.json"), str)
+
+def whisper_model_cached(name="tiny"):
+    cache_root = os.getenv("XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache"))
+    return os.path.exists(os.path.join(cache_root, "whisper", f"{name}.pt"))
+
+def language_tool_cached():
+    cache_dir = Path(os.path.expanduser("~")) / ".cache" / "language_tool_python"
+    return shutil.which("java") is not None and cache_dir.is_dir() and any(cache_dir.iterdir())
+
+def stand_in_translation():
+    """A one-layer T5 with random weights and the ByT5 byte tokenizer (no files needed)"""
+    from transformers import ByT5Tokenizer, T5Config, T5ForConditionalGeneration
+    torch.manual_seed(SEED)
+    config = T5Config(
+        vocab_size=384,
+        d_model=32,
+        d_kv=8,
+        d_ff=64,
+        num_layers=1,
+        num_decoder_layers=1,
+        num_heads=2,
+        pad_token_id=0,
+        eos_token_id=1,
+        decoder_start_token_id=0,
+    )
+    return T5ForConditionalGeneration(config).eval(), ByT5Tokenizer()
+
+class StandInTTSModel(torch.nn.Module):
+    """Maps each input token to a fixed burst of samples, with the VitsModel call interface"""
+    samples_per_token = 256
+
+    def __init__(self):
+        super().__init__()
+        torch.manual_seed(SEED)
+        self.config = SimpleNamespace(sampling_rate=16000)
+        self.embedding = torch.nn.Embedding(384, 32)
+        self.project = torch.nn.Linear(32, self.samples_per_token)
+
+    def forward(self, input_ids, attention_mask=None, **kwargs):
+        if attention_mask is None:
+            attention_mask = torch.ones_like(input_ids)
+        frames = torch.tanh(self.project(self.embedding(input_ids)))
+        frames = frames * attention_mask.unsqueeze(-1)
+        waveform = frames.reshape(input_ids.shape[0], -1)
+        sequence_lengths = attention_mask.sum(dim=1) * self.samples_per_token
+        return SimpleNamespace(waveform=waveform, sequence_lengths=sequence_lengths)
+
+def stand_in_tts():
+    from transformers import ByT5Tokenizer
+    return StandInTTSModel().eval(), ByT5Tokenizer()
+
+def stand_in_whisper():
+    """Whisper with the real multilingual vocabulary and audio shape, but one tiny layer each way"""
+    import whisper
+    from whisper.model import ModelDimensions, Whisper
+    torch.manual_seed(SEED)
+    dims = ModelDimensions(
+        n_mels=80,
+        n_audio_ctx=1500,
+        n_audio_state=64,
+        n_audio_head=1,
+        n_audio_layer=1,
+        n_vocab=51865,
+        n_text_ctx=448,
+        n_text_state=64,
+        n_text_head=1,
+        n_text_layer=1,
+    )
+    return Whisper(dims).eval()
+
+class StandInGrammarMatch:
+    def __init__(self, context, message, replacements):
+        self.context = context
+        self.message = message
+        self.replacements = replacements
+
+class StandInGrammarTool:
+    """A few fixed rules with the LanguageTool check() interface"""
+    def check(self, text):
+        matches = []
+        words = text.split()
+        for first, second in zip(words, words[1:]):
+            if first.lower() == second.lower():
+                matches.append(StandInGrammarMatch(f"{first} {second}", "Possible typo: you repeated a word", [first]))
+        for word in words:
+            if word == "i":
+                matches.append(StandInGrammarMatch(word, "The pronoun 'I' is always capitalized", ["I"]))
+        if "  " in text:
+            matches.append(StandInGrammarMatch("  ", "Possible typo: you repeated a whitespace", [" "]))
+        if text[:1].islower():
+            matches.append(StandInGrammarMatch(text[:20], "This sentence does not start with an uppercase letter", [text[:1].upper()]))
+        return matches
+
+def install_models(main, mode="auto"):
+    """
+    Put models into main's globals so its loaders find them already loaded.
+    mode "auto" keeps real models that are cached locally (main loads them
+    on first use); "stand-in" always uses stand-ins. Returns which model
+    each task ended up with.
+    """
+    os.environ.setdefault("HF_HUB_OFFLINE", "1")
+    real = mode == "auto"
+    used = {}
+
+    if real and hf_model_cached(TRANSLATION_MODEL_NAME):
+        used["translation"] = "real"
+    else:
+        main.translation_model, main.translation_tokenizer = stand_in_translation()
+        used["translation"] = "stand-in"
+
+    for lang, model_name in TTS_MODEL_NAMES.items():
+        if real and hf_model_cached(model_name):
+            used[f"tts_{lang}"] = "real"
+        else:
+            main.tts_models[lang], main.tts_tokenizers[lang] = stand_in_tts()
+            used[f"tts_{lang}"] = "stand-in"
+
+    if real and whisper_model_cached():
+        used["stt"] = "real"
+    else:
+        main.whisper_model = stand_in_whisper()
+        used["stt"] = "stand-in"
+
+    if real and language_tool_cached():
+        used["grammar"] = "real"
+    else:
+        main.tool_en = StandInGrammarTool()
+        used["grammar"] = "stand-in"
+    return used
@@ -0,0 +1,80 @@
+import os
+import random
+import sys
+import tempfile
+from time import perf_counter
+
+# Run against a throwaway SQLite database instead of the real one
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{tempfile.mkdtemp()}/translation_memory_benchmark.db")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from main import TranslationMemory, TRANSLATION_MEMORY_THRESHOLD
+
+ENTRY_COUNTS = [10000, 100000, 1000000]
+LOOKUPS = 2000
+SYLLABLES = "ba be bi bo bu ca co cu da de di do fa fe fi fo ga go ha he hi ho ka ke ki ko la le li lo lu ma me mi mo mu na ne ni no nu pa pe pi po ra re ri ro ru sa se si so su ta te ti to tu va ve vi vo wa we wi ya yo za zo".split()
+
+def vocabulary(rng, size=5000):
+    """Made-up words, so the character n-grams are about as varied as real text"""
+    words = set()
+    while len(words) < size:
+        words.add("".join(rng.choice(SYLLABLES) for _ in range(rng.randint(1, 4))))
+    return sorted(words)
+
+def sentence(rng, words):
+    return " ".join(rng.choice(words) for _ in range(rng.randint(6, 14))).capitalize() + "."
+
+def with_typo(rng, text):
+    """Swap two neighbouring letters in one word longer than four letters"""
+    words = text.split()
+    candidates = [i for i, word in enumerate(words) if len(word) > 4]
+    if not candidates:
+        return text + " please"
+    i = rng.choice(candidates)
+    j = rng.randrange(1, len(words[i]) - 2)
+    word = words[i]
+    words[i] = word[:j] + word[j + 1] + word[j] + word[j + 2:]
+    return " ".join(words)
+
+def time_lookups(memory, queries):
+    timings = []
+    hits = 0
+    for query in queries:
+        start = perf_counter()
+        match = memory.lookup(query, "eng")
+        timings.append(perf_counter() - start)
+        hits += match is not None
+    timings.sort()
+    return hits / len(queries), sum(timings) / len(timings), timings[int(len(timings) * 0.99)]
+
+def test_translation_memory_benchmark():
+    """Lookup latency and hit rate of the translation memory as it grows"""
+    print("===== Translation Memory Benchmark =====")
+    print(f"Similarity threshold: {TRANSLATION_MEMORY_THRESHOLD}")
+    print(f"{'Entries':>9} {'Build (s)':>10} {'Kind':>7} {'Hit rate':>9} {'Mean (us)':>10} {'p99 (us)':>9}")
+    rng = random.Random(0)
+    words = vocabulary(rng)
+    for count in ENTRY_COUNTS:
+        memory = TranslationMemory(TRANSLATION_MEMORY_THRESHOLD, count)
+        sources = []
+        start = perf_counter()
+        while len(memory) < count:
+            text = sentence(rng, words)
+            if memory.add(text, "eng", f"[vi] {text}"):
+                sources.append(text)
+        memory.merge(force=True)
+        build = perf_counter() - start
+
+        stored = [rng.choice(sources) for _ in range(LOOKUPS)]
+        kinds = {
+            "exact": [text.upper().rstrip(".") + "!" for text in stored],
+            "typo": [with_typo(rng, text) for text in stored],
+            "new": [sentence(rng, words) for _ in range(LOOKUPS)],
+        }
+        for kind, queries in kinds.items():
+            hit_rate, mean, p99 = time_lookups(memory, queries)
+            print(f"{count:>9} {build:>10.1f} {kind:>7} {hit_rate:>8.0%} {mean * 1e6:>10.0f} {p99 * 1e6:>9.0f}")
+        assert time_lookups(memory, kinds["exact"])[0] == 1.0
+
+if __name__ == "__main__":
+    test_translation_memory_benchmark()